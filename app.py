@@ -17,19 +17,28 @@ from __future__ import annotations
 
 import os
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
-# Попытка загрузить PyQt5. Если библиотеки нет (например, в среде
-# тестирования), импорт происходит в блоке `try` для того, чтобы
-# модуль оставался импортируемым. В таком случае GUI‑часть будет
-# недоступна, но функцию `import_excel_to_db()` можно тестировать.
+# python-calamine — потоковый Rust‑парсер XLSX: читает лист примерно в
+# 3 раза быстрее и на порядок экономнее по памяти, чем DOM‑режим
+# openpyxl. Пакет необязателен: при его наличии импорт идёт напрямую
+# через calamine в кортежи, минуя pandas; иначе работает путь на pandas.
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
 
 from PyQt5 import QtWidgets, QtCore, QtGui
 
-# Блок TYPE_CHECKING теперь не нужен для работы, 
-# так как библиотеки импортированы напрямую.
+# Обязательные колонки листов Excel; порядок соответствует полям таблиц
+# `holes` (name, x, y, z, lenght, _level, issue_date) и `assay`
+# (hole_name, _from, _to, Au).
+HOLES_COLS: Tuple[str, ...] = ("ИМЯ", "X", "Y", "Z", "ДЛИНА", "ГОРИЗОНТ", "ДАТА ПРОХОДКИ")
+ASSAY_COLS: Tuple[str, ...] = ("ОБЪЕКТ", "ОТ", "ДО", "Au")
 
 
 
@@ -46,295 +55,562 @@ def import_excel_to_db(excel_path: str, db_path: str) -> Tuple[bool, List[str]]:
         False, и список содержит сообщения об ошибках. В случае ошибки
         транзакция откатывается, база не модифицируется.
     """
-    errors = []
-    try:
-        # Конструкция 'with' гарантирует закрытие файла после чтения
-        with pd.ExcelFile(excel_path) as xls:
-            required_sheets = ["Holes", "Assay"]
-            for sheet in required_sheets:
-                if sheet not in xls.sheet_names:
-                    errors.append(f"Отсутствует лист '{sheet}' в Excel")
-            if errors: return False, errors
-
-            holes_df = xls.parse("Holes")
-            assay_df = xls.parse("Assay")
-            holes_df.rename(columns=lambda c: str(c).strip(), inplace=True)
-            assay_df.rename(columns=lambda c: str(c).strip(), inplace=True)
-    except Exception as e:
-        return False, [f"Ошибка чтения или разбора Excel: {e}"]
-    errors: List[str] = []
-    # Проверка существования файлов
+    # Проверка существования файла Excel; существование базы проверяет
+    # сам SQLite при открытии соединения в режиме mode=rw.
     if not os.path.isfile(excel_path):
         return False, [f"Файл Excel не найден: {excel_path}"]
-    if not os.path.isfile(db_path):
-        return False, [f"Файл базы данных не найден: {db_path}"]
+    # При наличии python-calamine листы читаются потоково сразу в кортежи
+    # для `executemany` — DataFrame для задачи «прочитать N строк и
+    # вставить N строк» не нужен. Путь через pandas остаётся резервным.
+    if python_calamine is not None:
+        return _import_via_calamine(excel_path, db_path)
+    return _import_via_pandas(excel_path, db_path)
+
+
+def _connect_for_import(db_path: str) -> sqlite3.Connection:
+    """Открывает соединение SQLite, настроенное под массовую загрузку.
+
+    `isolation_level=None` отключает неявное управление транзакциями в
+    модуле sqlite3 — границы задаются явными BEGIN/COMMIT, чтобы
+    автокоммит не вклинивался между пакетами. Увеличенный кеш
+    подготовленных запросов гарантирует, что тексты INSERT/UPDATE не
+    перекомпилируются между вызовами. PRAGMA: WAL вместо rollback-
+    журнала, fsync только в контрольных точках, временные структуры и
+    64 МиБ кеша страниц в памяти. Риск потери ограничен текущим
+    импортом — при ошибке транзакция и так откатывается.
+    """
+    # URI-режим mode=rw: SQLite сам отказывается открывать несуществующий
+    # файл (OperationalError) — отдельный stat(2) перед connect не нужен,
+    # и случайно создать пустую базу тоже нельзя.
+    conn = sqlite3.connect(
+        f"file:{db_path}?mode=rw", uri=True, isolation_level=None, cached_statements=256
+    )
+    conn.executescript(
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA cache_size=-65536;"
+    )
+    # Включаем принудительное использование внешних ключей (на всякий случай)
+    conn.execute("PRAGMA foreign_keys = ON;")
+    # Уникальный индекс по имени скважины: он позволяет выполнять
+    # обновление-или-вставку одним INSERT ... ON CONFLICT(name) прямо в
+    # SQLite, без ветвления на стороне Python.
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS ux_holes_name ON holes(name);")
+    return conn
+
+
+# Обновление-или-вставка скважины одним запросом; ветка выбирается
+# внутри SQLite по уникальному индексу ux_holes_name.
+_UPSERT_HOLE_SQL = (
+    "INSERT INTO holes (name, x, y, z, lenght, _level, issue_date) VALUES (?,?,?,?,?,?,?) "
+    "ON CONFLICT(name) DO UPDATE SET x = excluded.x, y = excluded.y, z = excluded.z, "
+    "lenght = excluded.lenght, _level = excluded._level, issue_date = excluded.issue_date"
+)
+
+
+# Размер пакета executemany при потоковой загрузке: достаточно большой,
+# чтобы амортизировать диспетчеризацию запросов, и достаточно маленький,
+# чтобы пиковая память не зависела от размера файла.
+_BATCH_ROWS = 10_000
+
+
+def _normalize_name(value) -> str:
+    """Приводит имя скважины к каноничной строке.
+
+    Числовые имена движки Excel возвращают по-разному: calamine отдаёт
+    float (101.0), pandas — int64 (101). Целочисленные float сводим к
+    int перед str(), чтобы оба пути импорта записывали одно и то же имя
+    и upsert по ux_holes_name не плодил варианты '101' и '101.0'.
+    """
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def _row_values(row: list, positions: List[int]) -> tuple:
+    """Выбирает из строки листа значения ожидаемых колонок.
+
+    Короткие строки (calamine обрезает замыкающие пустые ячейки)
+    дополняются None.
+    """
+    return tuple(row[i] if i < len(row) else None for i in positions)
+
+
+def _import_via_calamine(excel_path: str, db_path: str) -> Tuple[bool, List[str]]:
+    """Импорт напрямую через python-calamine, без pandas.
+
+    Листы читаются ленивыми итераторами строк и уходят в `executemany`
+    пакетами по `_BATCH_ROWS` кортежей: в памяти одновременно держится
+    только текущий пакет, поэтому потребление не зависит от размера
+    файла. Пустые ячейки проверяются тут же, по ходу чтения. При любой
+    ошибке транзакция откатывается, база не модифицируется.
+    """
+    errors: List[str] = []
     try:
-        # Загружаем книгу
-        xls = pd.ExcelFile(excel_path)
+        workbook = python_calamine.CalamineWorkbook.from_path(excel_path)
+        for sheet in ("Holes", "Assay"):
+            if sheet not in workbook.sheet_names:
+                errors.append(f"Отсутствует лист '{sheet}' в Excel")
+        if errors:
+            return False, errors
+        # Итераторы создаются один раз; первая строка каждого листа —
+        # заголовок, очищаем его от пробелов так же, как это делает
+        # `rename` в пути через pandas.
+        holes_iter = iter(workbook.get_sheet_by_name("Holes").iter_rows())
+        assay_iter = iter(workbook.get_sheet_by_name("Assay").iter_rows())
+        holes_header = [str(c).strip() for c in next(holes_iter, [])]
+        assay_header = [str(c).strip() for c in next(assay_iter, [])]
     except Exception as e:
-        return False, [f"Ошибка чтения Excel файла: {e}"]
+        return False, [f"Ошибка чтения или разбора Excel: {e}"]
 
-    # Проверяем наличие обязательных листов
-    required_sheets = ["Holes", "Assay"]
-    for sheet in required_sheets:
-        if sheet not in xls.sheet_names:
-            errors.append(f"Отсутствует лист '{sheet}' в Excel")
+    # Проверяем наличие колонок по заголовку листа
+    holes_index = {col: i for i, col in enumerate(holes_header)}
+    assay_index = {col: i for i, col in enumerate(assay_header)}
+    for col in HOLES_COLS:
+        if col not in holes_index:
+            errors.append(f"Колонка '{col}' отсутствует на листе Holes")
+    for col in ASSAY_COLS:
+        if col not in assay_index:
+            errors.append(f"Колонка '{col}' отсутствует на листе Assay")
     if errors:
         return False, errors
 
-    # Загружаем данные
     try:
-        holes_df = xls.parse("Holes")
-        assay_df = xls.parse("Assay")
-        # Удаляем возможные пробелы в именах колонок
-        holes_df.rename(columns=lambda c: str(c).strip(), inplace=True)
-        assay_df.rename(columns=lambda c: str(c).strip(), inplace=True)
+        conn = _connect_for_import(db_path)
+    except sqlite3.OperationalError as e:
+        # «Файл не найден» — только когда mode=rw не смог открыть файл;
+        # прочие OperationalError (например, отсутствующая таблица при
+        # создании индекса) — это ошибки базы, а не отсутствующий файл.
+        if e.sqlite_errorcode == sqlite3.SQLITE_CANTOPEN:
+            return False, [f"Файл базы данных не найден: {db_path}"]
+        return False, [f"Ошибка базы данных: {e}"]
+    except sqlite3.Error as e:
+        # Настройка соединения может не удаться и на существующем файле:
+        # например, ux_holes_name не создаётся, если в базе уже есть
+        # дубликаты имён скважин. Возвращаем ошибку, а не исключение.
+        return False, [f"Ошибка базы данных: {e}"]
+
+    try:
+        cur = conn.cursor()
+        cur.execute("BEGIN")
+
+        # Скважины: потоковый upsert пакетами. Пустые ячейки (calamine
+        # отдаёт их как None либо пустую строку) лишь поднимают флаг —
+        # дальнейшие вставки пропускаются, итоговый откат один на всех.
+        holes_empty = False
+        positions = [holes_index[col] for col in HOLES_COLS]
+        batch: List[tuple] = []
+        for row in holes_iter:
+            values = _row_values(row, positions)
+            if any(v is None or v == "" for v in values):
+                holes_empty = True
+            if holes_empty:
+                continue
+            # Имя нормализуем ещё до вставки: TEXT-аффинность колонки
+            # name всё равно сохранит его строкой, и без нормализации
+            # числовое имя из листа не нашлось бы в отображении имя -> id,
+            # перечитанном из базы.
+            batch.append((_normalize_name(values[0]),) + values[1:])
+            if len(batch) >= _BATCH_ROWS:
+                cur.executemany(_UPSERT_HOLE_SQL, batch)
+                batch.clear()
+        if batch:
+            cur.executemany(_UPSERT_HOLE_SQL, batch)
+            batch.clear()
+
+        # id присвоены внутри SQLite, читаем отображение имя -> id разом
+        hole_name_to_id: Dict[str, int] = {
+            name: hole_id for hole_id, name in cur.execute("SELECT id, name FROM holes")
+        }
+
+        # Опробование: тем же потоком, с проверкой ссылок на скважины.
+        # Лист дочитывается и при уже найденных ошибках, чтобы собрать
+        # полный список сообщений, но вставки при этом не выполняются.
+        assay_empty = False
+        missing: List[Tuple[int, str]] = []
+        positions = [assay_index[col] for col in ASSAY_COLS]
+        for idx, row in enumerate(assay_iter):
+            values = _row_values(row, positions)
+            if any(v is None or v == "" for v in values):
+                assay_empty = True
+                continue
+            # Та же нормализация, что и при вставке скважин: ссылка
+            # сравнивается со строковыми именами из базы
+            name = _normalize_name(values[0])
+            hole_id = hole_name_to_id.get(name)
+            if hole_id is None:
+                missing.append((idx, name))
+                continue
+            if holes_empty or assay_empty or missing:
+                continue
+            batch.append((hole_id,) + values[1:])
+            if len(batch) >= _BATCH_ROWS:
+                cur.executemany(
+                    "INSERT INTO assay (hole_id, _from, _to, Au) VALUES (?,?,?,?)", batch
+                )
+                batch.clear()
+        if batch:
+            cur.executemany(
+                "INSERT INTO assay (hole_id, _from, _to, Au) VALUES (?,?,?,?)", batch
+            )
+
+        if holes_empty:
+            errors.append("В листе Holes обнаружены пустые значения. Пожалуйста, заполните все поля.")
+        if assay_empty:
+            errors.append("В листе Assay обнаружены пустые значения. Пожалуйста, заполните все поля.")
+        if not errors and missing:
+            errors.extend(
+                f"Скважина '{name}' отсутствует в листе Holes, строка {idx + 2}"
+                for idx, name in missing
+            )
+        if errors:
+            # При ошибках откатываем изменения
+            conn.rollback()
+            conn.close()
+            return False, errors
+
+        conn.commit()
+        conn.close()
+        return True, []
     except Exception as e:
-        return False, [f"Ошибка разбора листов: {e}"]
-
-    # Ожидаемые колонки и их соответствие полям в БД
-    holes_cols: Dict[str, str] = {
-        "ИМЯ": "name",
-        "X": "x",
-        "Y": "y",
-        "Z": "z",
-        "ДЛИНА": "lenght",
-        "ГОРИЗОНТ": "_level",
-        "ДАТА ПРОХОДКИ": "issue_date",
-    }
-    assay_cols: Dict[str, str] = {
-        "ОБЪЕКТ": "hole_name",
-        "ОТ": "_from",
-        "ДО": "_to",
-        "Au": "Au",
-    }
+        # При исключениях также откатываем изменения; `conn` к этому
+        # моменту гарантированно открыт — connect выполняется выше,
+        # в собственном try.
+        conn.rollback()
+        conn.close()
+        return False, [f"Ошибка базы данных: {e}"]
+
+
+def _import_via_pandas(excel_path: str, db_path: str) -> Tuple[bool, List[str]]:
+    """Резервный путь импорта через pandas (python-calamine недоступен)."""
+    errors = []
+    # Листы Holes и Assay независимы, а распаковка и разбор XML по
+    # большей части выполняются в C с отпущенным GIL, поэтому читаем их
+    # двумя параллельными вызовами read_excel — разбор XLSX доминирует
+    # во времени импорта.
+    frames: Dict[str, pd.DataFrame] = {}
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = {
+            sheet: pool.submit(pd.read_excel, excel_path, sheet_name=sheet)
+            for sheet in ("Holes", "Assay")
+        }
+        for sheet, future in futures.items():
+            try:
+                frames[sheet] = future.result()
+            except ValueError as e:
+                # pandas поднимает ValueError и для отсутствующего листа,
+                # и для нечитаемого файла; различаем их по сообщению
+                if "Worksheet named" in str(e):
+                    errors.append(f"Отсутствует лист '{sheet}' в Excel")
+                else:
+                    return False, [f"Ошибка чтения или разбора Excel: {e}"]
+            except Exception as e:
+                return False, [f"Ошибка чтения или разбора Excel: {e}"]
+    if errors:
+        return False, errors
+
+    holes_df = frames["Holes"]
+    assay_df = frames["Assay"]
+    # Удаляем возможные пробелы в именах колонок
+    holes_df.rename(columns=lambda c: str(c).strip(), inplace=True)
+    assay_df.rename(columns=lambda c: str(c).strip(), inplace=True)
 
     # Проверяем наличие колонок
-    for col in holes_cols:
-        if col not in holes_df.columns:
+    holes_columns = set(holes_df.columns)
+    assay_columns = set(assay_df.columns)
+    for col in HOLES_COLS:
+        if col not in holes_columns:
             errors.append(f"Колонка '{col}' отсутствует на листе Holes")
-    for col in assay_cols:
-        if col not in assay_df.columns:
+    for col in ASSAY_COLS:
+        if col not in assay_columns:
             errors.append(f"Колонка '{col}' отсутствует на листе Assay")
     if errors:
         return False, errors
 
-    # Проверяем пустые значения
-    if holes_df[list(holes_cols.keys())].isnull().any().any():
+    # Проверяем пустые значения: один C-проход `any` по булеву ndarray
+    # вместо двух последовательных редукций с промежуточным Series.
+    if holes_df[list(HOLES_COLS)].isna().to_numpy().any():
         errors.append("В листе Holes обнаружены пустые значения. Пожалуйста, заполните все поля.")
-    if assay_df[list(assay_cols.keys())].isnull().any().any():
+    if assay_df[list(ASSAY_COLS)].isna().to_numpy().any():
         errors.append("В листе Assay обнаружены пустые значения. Пожалуйста, заполните все поля.")
     if errors:
         return False, errors
 
-    # Подключаемся к базе и начинаем транзакцию
     try:
-        conn = sqlite3.connect(db_path)
-        cur = conn.cursor()
-        # Включаем принудительное использование внешних ключей (на всякий случай)
-        cur.execute("PRAGMA foreign_keys = ON;")
-
-        # Создаём отображение имя скважины -> id (если в базе уже есть)
-        hole_name_to_id: Dict[str, int] = {}
-        cur.execute("SELECT id, name FROM holes")
-        for row in cur.fetchall():
-            hole_name_to_id[row[1]] = row[0]
-
-        # Обрабатываем скважины. Если скважина с таким именем уже есть в БД,
-        # мы не дублируем её, но можем обновить координаты/другие поля.
-        for idx, row in holes_df.iterrows():
-            name = row["ИМЯ"]
-            x_val = row["X"]
-            y_val = row["Y"]
-            z_val = row["Z"]
-            length_val = row["ДЛИНА"]
-            level_val = row["ГОРИЗОНТ"]
-            issue_date_val = row["ДАТА ПРОХОДКИ"]
-
-            if name in hole_name_to_id:
-                # Обновляем существующую запись, чтобы данные оставались актуальными
-                hole_id = hole_name_to_id[name]
-                cur.execute(
-                    "UPDATE holes SET x = ?, y = ?, z = ?, lenght = ?, _level = ?, issue_date = ? WHERE id = ?",
-                    (x_val, y_val, z_val, length_val, level_val, issue_date_val, hole_id),
-                )
-            else:
-                # Вставляем новую запись
-                cur.execute(
-                    "INSERT INTO holes (name, x, y, z, lenght, _level, issue_date) VALUES (?,?,?,?,?,?,?)",
-                    (name, x_val, y_val, z_val, length_val, level_val, issue_date_val),
-                )
-                hole_id = cur.lastrowid
-                hole_name_to_id[name] = hole_id
+        conn = _connect_for_import(db_path)
+    except sqlite3.OperationalError as e:
+        # «Файл не найден» — только когда mode=rw не смог открыть файл;
+        # прочие OperationalError (например, отсутствующая таблица при
+        # создании индекса) — это ошибки базы, а не отсутствующий файл.
+        if e.sqlite_errorcode == sqlite3.SQLITE_CANTOPEN:
+            return False, [f"Файл базы данных не найден: {db_path}"]
+        return False, [f"Ошибка базы данных: {e}"]
+    except sqlite3.Error as e:
+        # Настройка соединения может не удаться и на существующем файле:
+        # например, ux_holes_name не создаётся, если в базе уже есть
+        # дубликаты имён скважин. Возвращаем ошибку, а не исключение.
+        return False, [f"Ошибка базы данных: {e}"]
 
-        # Обрабатываем опробование (assay)
-        for idx, row in assay_df.iterrows():
-            hole_name = row["ОБЪЕКТ"]
-            from_val = row["ОТ"]
-            to_val = row["ДО"]
-            au_val = row["Au"]
+    # Начинаем транзакцию
+    try:
+        cur = conn.cursor()
 
-            hole_id = hole_name_to_id.get(hole_name)
-            if hole_id is None:
-                # Скважины может не быть, это ошибка
-                errors.append(f"Скважина '{hole_name}' отсутствует в листе Holes, строка {idx + 2}")
-                continue
-            # Вставляем запись опробования
-            cur.execute(
-                "INSERT INTO assay (hole_id, _from, _to, Au) VALUES (?,?,?,?)",
-                (hole_id, from_val, to_val, au_val),
+        # Все ссылки опробования на скважины проверяем до любой записи:
+        # допустимы имена из базы и из листа Holes. Маска ошибок
+        # считается векторно через `isin`; при ошибке соединение
+        # закрывается без транзакции — в базу не пишется ни строки.
+        # Имена нормализуем ещё до вставки: TEXT-аффинность колонки
+        # name всё равно сохранит их строками, и без нормализации
+        # числовое имя из листа не нашлось бы в отображении имя -> id,
+        # перечитанном из базы. Хелпер общий с путём через calamine,
+        # чтобы оба пути записывали одинаковые строки.
+        hole_names = holes_df[HOLES_COLS[0]].map(_normalize_name).to_numpy()
+        assay_names = assay_df["ОБЪЕКТ"].map(_normalize_name)
+        valid_names = {name for (name,) in cur.execute("SELECT name FROM holes")}
+        valid_names.update(hole_names)
+        missing_mask = ~assay_names.isin(valid_names)
+        if missing_mask.any():
+            errors.extend(
+                f"Скважина '{name}' отсутствует в листе Holes, строка {idx + 2}"
+                for idx, name in zip(
+                    missing_mask[missing_mask].index,
+                    assay_names[missing_mask],
+                )
             )
-
-        if errors:
-            # При ошибках откатываем изменения
-            conn.rollback()
             conn.close()
             return False, errors
 
+        # Обрабатываем скважины одним пакетом upsert-ов: выбор между
+        # обновлением и вставкой делает сам SQLite по индексу
+        # ux_holes_name, ветвление на стороне Python не нужно.
+        # `iterrows()` строит Series на каждую строку; вместо этого
+        # вынимаем колонки целиком и собираем их zip-ом. `tolist()` даёт
+        # скаляры Python: скаляры NumPy (np.int64 и т.п.) sqlite3 привязал
+        # бы как BLOB, а не как число.
+        hole_cols = tuple(holes_df[col].tolist() for col in HOLES_COLS[1:])
+        holes_rows = list(zip(hole_names, *hole_cols))
+
+        cur.execute("BEGIN")
+        if holes_rows:
+            cur.executemany(_UPSERT_HOLE_SQL, holes_rows)
+
+        # id присвоены внутри SQLite, читаем отображение имя -> id разом.
+        # Курсор итерируется напрямую, без промежуточного списка fetchall().
+        hole_name_to_id: Dict[str, int] = {
+            name: hole_id for hole_id, name in cur.execute("SELECT id, name FROM holes")
+        }
+
+        # Обрабатываем опробование (assay): нормализованные ссылки уже
+        # проверены, поэтому `map` по словарю даёт id без пропусков.
+        mapped_ids = assay_names.map(hole_name_to_id)
+        assay_rows = list(
+            zip(
+                mapped_ids.astype(int).tolist(),
+                assay_df["ОТ"].tolist(),
+                assay_df["ДО"].tolist(),
+                assay_df["Au"].tolist(),
+            )
+        )
+        if assay_rows:
+            cur.executemany(
+                "INSERT INTO assay (hole_id, _from, _to, Au) VALUES (?,?,?,?)",
+                assay_rows,
+            )
+
         conn.commit()
         conn.close()
         return True, []
     except Exception as e:
-        # При исключениях также откатываем изменения
-        if 'conn' in locals():
-            conn.rollback()
-            conn.close()
+        # При исключениях также откатываем изменения; `conn` к этому
+        # моменту гарантированно открыт — connect выполняется выше,
+        # в собственном try.
+        conn.rollback()
+        conn.close()
         return False, [f"Ошибка базы данных: {e}"]
 
 
-if QtWidgets is not None:
-    class ImportWidget(QtWidgets.QWidget):
-        """виджет для импорта Excel‑файлов в SQLite и просмотра данных."""
-
-        def __init__(self, db_path: str, parent = None) -> None:
-            super().__init__(parent)
-            self.db_path = db_path
-            self.setup_ui()
-
-        def setup_ui(self) -> None:
-            self.setWindowTitle("Импорт журнала в базу данных")
-
-            root = QtWidgets.QVBoxLayout(self)
-
-            # ===== Верхний блок (как на схеме) =====
-            top_box = QtWidgets.QGroupBox(self)
-            top_box.setTitle("")                      # без заголовка
-            top_box.setFlat(False)
-            top_layout = QtWidgets.QGridLayout(top_box)
-            top_layout.setContentsMargins(12, 12, 12, 12)
-            top_layout.setHorizontalSpacing(10)
-            top_layout.setVerticalSpacing(10)
-
-            # input1 + btn1 (в одной строке)
-            self.file_line_edit = QtWidgets.QLineEdit(top_box)
-            self.file_line_edit.setPlaceholderText("Выберите Excel файл...")
-
-            btn_browse = QtWidgets.QPushButton("Обзор", top_box)
-            btn_browse.setFixedWidth(110)             # чтобы был компактным как на схеме
-            btn_browse.clicked.connect(self.browse_file)
-
-            top_layout.addWidget(self.file_line_edit, 0, 0, 1, 1)
-            top_layout.addWidget(btn_browse,          0, 1, 1, 1, alignment=QtCore.Qt.AlignRight)
-
-            # btn2 справа ниже
-            self.btn_import = QtWidgets.QPushButton("Импортировать", top_box)
-            self.btn_import.setFixedWidth(160)
-            self.btn_import.clicked.connect(self.handle_import)
-
-            top_layout.addWidget(self.btn_import, 1, 1, alignment=QtCore.Qt.AlignRight)
-
-            # растяжки, чтобы btn2 был "в середине блока", как на макете
-            top_layout.setRowStretch(0, 0)
-            top_layout.setRowStretch(1, 1)  # “пустота” под первой строкой
-            top_layout.setColumnStretch(0, 1)  # input растягивается
-            top_layout.setColumnStretch(1, 0)  # кнопки фикс.ширины
-
-            root.addWidget(top_box, stretch=0)
-
-            # ===== Нижний блок =====
-            bottom_box = QtWidgets.QGroupBox(self)
-            bottom_box.setTitle("")
-            bottom_layout = QtWidgets.QGridLayout(bottom_box)
-            bottom_layout.setContentsMargins(12, 12, 12, 12)
-            bottom_layout.setHorizontalSpacing(10)
-            bottom_layout.setVerticalSpacing(10)
-
-            # btn3 справа сверху
-            self.btn_show = QtWidgets.QPushButton("Показать данные", bottom_box)
-            self.btn_show.setFixedWidth(160)
-            self.btn_show.clicked.connect(self.show_data)
-            bottom_layout.addWidget(self.btn_show, 0, 1, alignment=QtCore.Qt.AlignRight)
-
-            # table1 ниже на всю ширину
-            self.table = QtWidgets.QTableWidget(bottom_box)
-            self.table.setColumnCount(4)
-            self.table.setHorizontalHeaderLabels(["Имя скважины", "ОТ", "ДО", "Au"])
-            bottom_layout.addWidget(self.table, 1, 0, 1, 2)
-
-            bottom_layout.setColumnStretch(0, 1)
-            bottom_layout.setColumnStretch(1, 0)
-            bottom_layout.setRowStretch(1, 1)
-
-            root.addWidget(bottom_box, stretch=1)
-
-
-        def browse_file(self) -> None:
-            """Открывает диалог выбора файла и отображает путь."""
-            options = QtWidgets.QFileDialog.Options()
-            file_name, _ = QtWidgets.QFileDialog.getOpenFileName(
-                self,
-                "Выберите Excel файл",
-                "",
-                "Excel Files (*.xlsx *.xls);;All Files (*)",
-                options=options,
+class AssayTableModel(QtCore.QAbstractTableModel):
+    """Модель данных опробования для QTableView.
+
+    Колонки хранятся отдельными списками (structure-of-arrays), а
+    значения отдаются через `data()` — то есть лишь для ячеек, которые
+    Qt реально отрисовывает. Это избавляет от создания 4×N объектов
+    QTableWidgetItem при загрузке.
+    """
+
+    HEADERS = ("Имя скважины", "ОТ", "ДО", "Au")
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._cols: List[list] = [[] for _ in self.HEADERS]
+
+    def set_dataframe(self, df: pd.DataFrame) -> None:
+        """Заменяет содержимое модели колонками DataFrame одним сбросом.
+
+        Колонки сохраняются массивами NumPy как есть: ни списка кортежей,
+        ни PyObject-обёрток на каждую строку — значение достаётся из
+        непрерывного массива только при отрисовке ячейки.
+        """
+        self.beginResetModel()
+        self._cols = [df[col].to_numpy() for col in df.columns]
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._cols[0])
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.DisplayRole:
+            return None
+        value = self._cols[index.column()][index.row()]
+        # NULL/NaN показываем пустой ячейкой, а не текстом "None"; числа
+        # отдаём как есть — Qt сам форматирует и выравнивает их.
+        if value is None or (isinstance(value, float) and value != value):
+            return ""
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class ImportWidget(QtWidgets.QWidget):
+    """виджет для импорта Excel‑файлов в SQLite и просмотра данных."""
+
+    def __init__(self, db_path: str, parent = None) -> None:
+        super().__init__(parent)
+        self.db_path = db_path
+        self.setup_ui()
+
+    def setup_ui(self) -> None:
+        self.setWindowTitle("Импорт журнала в базу данных")
+
+        root = QtWidgets.QVBoxLayout(self)
+
+        # ===== Верхний блок (как на схеме) =====
+        top_box = QtWidgets.QGroupBox(self)
+        top_box.setTitle("")                      # без заголовка
+        top_box.setFlat(False)
+        top_layout = QtWidgets.QGridLayout(top_box)
+        top_layout.setContentsMargins(12, 12, 12, 12)
+        top_layout.setHorizontalSpacing(10)
+        top_layout.setVerticalSpacing(10)
+
+        # input1 + btn1 (в одной строке)
+        self.file_line_edit = QtWidgets.QLineEdit(top_box)
+        self.file_line_edit.setPlaceholderText("Выберите Excel файл...")
+
+        btn_browse = QtWidgets.QPushButton("Обзор", top_box)
+        btn_browse.setFixedWidth(110)             # чтобы был компактным как на схеме
+        btn_browse.clicked.connect(self.browse_file)
+
+        top_layout.addWidget(self.file_line_edit, 0, 0, 1, 1)
+        top_layout.addWidget(btn_browse,          0, 1, 1, 1, alignment=QtCore.Qt.AlignRight)
+
+        # btn2 справа ниже
+        self.btn_import = QtWidgets.QPushButton("Импортировать", top_box)
+        self.btn_import.setFixedWidth(160)
+        self.btn_import.clicked.connect(self.handle_import)
+
+        top_layout.addWidget(self.btn_import, 1, 1, alignment=QtCore.Qt.AlignRight)
+
+        # растяжки, чтобы btn2 был "в середине блока", как на макете
+        top_layout.setRowStretch(0, 0)
+        top_layout.setRowStretch(1, 1)  # “пустота” под первой строкой
+        top_layout.setColumnStretch(0, 1)  # input растягивается
+        top_layout.setColumnStretch(1, 0)  # кнопки фикс.ширины
+
+        root.addWidget(top_box, stretch=0)
+
+        # ===== Нижний блок =====
+        bottom_box = QtWidgets.QGroupBox(self)
+        bottom_box.setTitle("")
+        bottom_layout = QtWidgets.QGridLayout(bottom_box)
+        bottom_layout.setContentsMargins(12, 12, 12, 12)
+        bottom_layout.setHorizontalSpacing(10)
+        bottom_layout.setVerticalSpacing(10)
+
+        # btn3 справа сверху
+        self.btn_show = QtWidgets.QPushButton("Показать данные", bottom_box)
+        self.btn_show.setFixedWidth(160)
+        self.btn_show.clicked.connect(self.show_data)
+        bottom_layout.addWidget(self.btn_show, 0, 1, alignment=QtCore.Qt.AlignRight)
+
+        # table1 ниже на всю ширину
+        # QTableView поверх модели: данные остаются в модели, ячейки
+        # создаются только для отрисовываемой области.
+        self.table_model = AssayTableModel(self)
+        self.table = QtWidgets.QTableView(bottom_box)
+        self.table.setModel(self.table_model)
+        # Ширина колонок подстраивается самим заголовком; так не нужен
+        # отдельный проход resizeColumnsToContents() после заполнения.
+        self.table.horizontalHeader().setSectionResizeMode(
+            QtWidgets.QHeaderView.ResizeToContents
+        )
+        bottom_layout.addWidget(self.table, 1, 0, 1, 2)
+
+        bottom_layout.setColumnStretch(0, 1)
+        bottom_layout.setColumnStretch(1, 0)
+        bottom_layout.setRowStretch(1, 1)
+
+        root.addWidget(bottom_box, stretch=1)
+
+
+    def browse_file(self) -> None:
+        """Открывает диалог выбора файла и отображает путь."""
+        options = QtWidgets.QFileDialog.Options()
+        file_name, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self,
+            "Выберите Excel файл",
+            "",
+            "Excel Files (*.xlsx *.xls);;All Files (*)",
+            options=options,
+        )
+        if file_name:
+            self.file_line_edit.setText(file_name)
+
+    def handle_import(self) -> None:
+        """Запускает импорт выбранного файла."""
+        excel_path = self.file_line_edit.text().strip()
+        if not excel_path:
+            QtWidgets.QMessageBox.warning(self, "Внимание", "Пожалуйста, выберите Excel файл.")
+            return
+        success, messages = import_excel_to_db(excel_path, self.db_path)
+        if success:
+            QtWidgets.QMessageBox.information(self, "Успех", "Данные успешно импортированы.")
+        else:
+            QtWidgets.QMessageBox.critical(self, "Ошибка", "\n".join(messages))
+
+    def show_data(self) -> None:
+        """Загружает данные из БД и отображает в таблице."""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            # Делаем JOIN, чтобы получить имя скважины и опробование
+            query = (
+                "SELECT h.name, a._from, a._to, a.Au "
+                "FROM assay a JOIN holes h ON a.hole_id = h.id "
+                "ORDER BY h.name, a._from"
             )
-            if file_name:
-                self.file_line_edit.setText(file_name)
-
-        def handle_import(self) -> None:
-            """Запускает импорт выбранного файла."""
-            excel_path = self.file_line_edit.text().strip()
-            if not excel_path:
-                QtWidgets.QMessageBox.warning(self, "Внимание", "Пожалуйста, выберите Excel файл.")
-                return
-            success, messages = import_excel_to_db(excel_path, self.db_path)
-            if success:
-                QtWidgets.QMessageBox.information(self, "Успех", "Данные успешно импортированы.")
-            else:
-                QtWidgets.QMessageBox.critical(self, "Ошибка", "\n".join(messages))
-
-        def show_data(self) -> None:
-            """Загружает данные из БД и отображает в таблице."""
-            try:
-                conn = sqlite3.connect(self.db_path)
-                cur = conn.cursor()
-                # Делаем JOIN, чтобы получить имя скважины и опробование
-                query = (
-                    "SELECT h.name, a._from, a._to, a.Au "
-                    "FROM assay a JOIN holes h ON a.hole_id = h.id "
-                    "ORDER BY h.name, a._from"
-                )
-                rows = cur.execute(query).fetchall()
-                conn.close()
-            except Exception as e:
-                QtWidgets.QMessageBox.critical(self, "Ошибка", f"Не удалось загрузить данные: {e}")
-                return
-            # Заполняем таблицу
-            self.table.setRowCount(len(rows))
-            for row_idx, (name, from_val, to_val, au_val) in enumerate(rows):
-                self.table.setItem(row_idx, 0, QtWidgets.QTableWidgetItem(str(name)))
-                self.table.setItem(row_idx, 1, QtWidgets.QTableWidgetItem(str(from_val)))
-                self.table.setItem(row_idx, 2, QtWidgets.QTableWidgetItem(str(to_val)))
-                self.table.setItem(row_idx, 3, QtWidgets.QTableWidgetItem(str(au_val)))
-            self.table.resizeColumnsToContents()
+            # read_sql_query отдаёт колонки непрерывными массивами —
+            # готовый SoA для модели, без списка кортежей fetchall()
+            df = pd.read_sql_query(query, conn)
+            conn.close()
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "Ошибка", f"Не удалось загрузить данные: {e}")
+            return
+        # Подменяем данные модели одним сбросом: никакого цикла по
+        # ячейкам, представление само запросит видимые значения.
+        self.table_model.set_dataframe(df)
 
 
 def main() -> None:
     """Точка входа для запуска приложения вручную."""
-    if QtWidgets is None:
-        raise SystemExit(
-            "PyQt5 не установлена в текущей среде. Для запуска GUI установите пакет PyQt5 или PySide6."
-        )
     import argparse
 
     parser = argparse.ArgumentParser(description="Импорт Excel в SQLite и просмотр данных.")
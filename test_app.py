@@ -53,6 +53,73 @@ class TestImportExcel(unittest.TestCase):
         self.assertGreaterEqual(assay_count, 5)
 
 
+    def test_reimport_same_file(self) -> None:
+        "проверяет, что повторный импорт того же файла не дублирует скважины."
+        original_db = os.path.join(Path(__file__).resolve().parent, "database")
+        temp_db = create_temp_db(original_db)
+        excel_path = os.path.join(Path(__file__).resolve().parent, "journal.xlsx")
+
+        success, errors = app.import_excel_to_db(excel_path, temp_db)
+        self.assertTrue(success, f"первый импорт должен пройти успешно: {errors}")
+        conn = sqlite3.connect(temp_db)
+        holes_after_first = conn.execute("SELECT COUNT(*) FROM holes").fetchone()[0]
+        conn.close()
+
+        success, errors = app.import_excel_to_db(excel_path, temp_db)
+        self.assertTrue(success, f"повторный импорт должен пройти успешно: {errors}")
+        conn = sqlite3.connect(temp_db)
+        holes_after_second = conn.execute("SELECT COUNT(*) FROM holes").fetchone()[0]
+        conn.close()
+        self.assertEqual(
+            holes_after_second,
+            holes_after_first,
+            "повторный импорт не должен добавлять дубликаты скважин",
+        )
+
+
+    def test_numeric_hole_names(self) -> None:
+        "проверяет импорт числовых имён скважин (ИМЯ/ОБЪЕКТ заданы числами)."
+        temp_db = create_temp_db(os.path.join(Path(__file__).resolve().parent, "database"))
+        # числовые имена движки Excel возвращают числами (calamine — float,
+        # pandas — int64); оба пути должны записать одно и то же имя '101'
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            with pd.ExcelWriter(tmp.name) as writer:
+                pd.DataFrame({"ИМЯ": [101],
+                                "X": [0],
+                                "Y": [0],
+                                "Z": [0],
+                                "ДЛИНА": [10],
+                                "ГОРИЗОНТ": [100],
+                                "ДАТА ПРОХОДКИ": [20231231]}).to_excel(writer, sheet_name="Holes", index=False)
+                pd.DataFrame({"ОБЪЕКТ": [101],
+                                "ОТ": [0],
+                                "ДО": [1],
+                                "Au": [1.0]}).to_excel(writer, sheet_name="Assay", index=False)
+            excel_path = tmp.name
+
+        success, errors = app.import_excel_to_db(excel_path, temp_db)
+        self.assertTrue(success, f"импорт числовых имён должен пройти успешно: {errors}")
+
+        conn = sqlite3.connect(temp_db)
+        assay_count = conn.execute(
+            "SELECT COUNT(*) FROM assay JOIN holes ON assay.hole_id = holes.id "
+            "WHERE holes.name = '101'"
+        ).fetchone()[0]
+        conn.close()
+        self.assertEqual(assay_count, 1, "строка опробования должна привязаться к скважине '101'")
+
+        # повторный импорт не должен создать вариант '101.0' рядом со '101'
+        success, errors = app.import_excel_to_db(excel_path, temp_db)
+        self.assertTrue(success, f"повторный импорт должен пройти успешно: {errors}")
+
+        conn = sqlite3.connect(temp_db)
+        names = [row[0] for row in conn.execute(
+            "SELECT name FROM holes WHERE name LIKE '101%'"
+        ).fetchall()]
+        conn.close()
+        self.assertEqual(names, ["101"], "числовое имя должно храниться в одном каноничном виде")
+
+
     def test_missing_sheet(self) -> None:
         "проверяет, что при отсутствии листа Holes возникает ошибка."
         temp_db = create_temp_db(os.path.join(Path(__file__).resolve().parent, "database"))
@@ -151,5 +218,24 @@ class TestImportExcel(unittest.TestCase):
         
         # Сравниваем с initial_count, а не с нулем!
         self.assertEqual(current_count, initial_count, "база должна была откатиться к исходному состоянию")
+
+
+class TestImportExcelPandasFallback(TestImportExcel):
+    """повторяет весь набор тестов для резервного пути импорта через pandas.
+
+    Основной класс проверяет тот путь, который выбирается в текущем
+    окружении (при установленном python-calamine — потоковый); здесь
+    calamine принудительно отключается, чтобы путь через pandas
+    прогонялся всегда, независимо от установленных пакетов.
+    """
+
+    def setUp(self) -> None:
+        self._python_calamine = app.python_calamine
+        app.python_calamine = None
+
+    def tearDown(self) -> None:
+        app.python_calamine = self._python_calamine
+
+
 if __name__ == "__main__":
     unittest.main()